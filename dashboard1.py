@@ -1,10 +1,17 @@
 import io
+import hashlib
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.feather as feather
+import polars as pl
+from numba import njit, types
 import streamlit as st
-import plotly.express as px
 import plotly.graph_objects as go
 import plotly.io as pio
+from plotly_resampler import FigureResampler
+from plotly_resampler.aggregation import MinMaxLTTB
 
 # =========================
 # Palette (Green tones)
@@ -20,27 +27,27 @@ GRIDCOLOR = "#D9F2E2"            # 격자선 (밝은 그린 톤)
 PAPER_BG = "#FFFFFF"             # 차트 바깥
 PLOT_BG  = "#F7FCF9"             # 차트 안쪽 (연녹색톤)
 
-# Plotly 템플릿
-pio.templates["custom_green"] = go.layout.Template(
-    layout=dict(
-        colorway=COLORWAY,
-        font=dict(family="Pretendard, Noto Sans KR, Segoe UI, Roboto, Arial", size=13, color=P0),
-        paper_bgcolor=PAPER_BG,
-        plot_bgcolor=PLOT_BG,
-        xaxis=dict(gridcolor=GRIDCOLOR, zerolinecolor=GRIDCOLOR),
-        yaxis=dict(gridcolor=GRIDCOLOR, zerolinecolor=GRIDCOLOR),
-        legend=dict(bordercolor="#E6EAF0", borderwidth=0),
-        margin=dict(l=20, r=20, t=30, b=30)
-    )
-)
-pio.templates.default = "custom_green"
+N_SHOWN_SAMPLES = 1000           # 라인 차트에 실제로 전송할 최대 포인트 수
 
 # =========================
-# Streamlit 기본 설정 + 스타일
+# Plotly 템플릿 + 전역 CSS (프로세스당 1회만 구성)
 # =========================
-st.set_page_config(page_title="월별 매출 대시보드", layout="wide", page_icon="📊")
-st.markdown(
-    f"""
+@st.cache_resource(show_spinner=False)
+def _init_theme() -> str:
+    pio.templates["custom_green"] = go.layout.Template(
+        layout=dict(
+            colorway=COLORWAY,
+            font=dict(family="Pretendard, Noto Sans KR, Segoe UI, Roboto, Arial", size=13, color=P0),
+            paper_bgcolor=PAPER_BG,
+            plot_bgcolor=PLOT_BG,
+            xaxis=dict(gridcolor=GRIDCOLOR, zerolinecolor=GRIDCOLOR),
+            yaxis=dict(gridcolor=GRIDCOLOR, zerolinecolor=GRIDCOLOR),
+            legend=dict(bordercolor="#E6EAF0", borderwidth=0),
+            margin=dict(l=20, r=20, t=30, b=30)
+        )
+    )
+    pio.templates.default = "custom_green"
+    return f"""
     <style>
         .stApp {{
             background: linear-gradient(180deg, #f7f9fc 0%, {P4} 100%);
@@ -68,6 +75,16 @@ st.markdown(
         .stButton > button:hover {{
             background: {P1};
         }}
+        .kpi-grid {{
+            display: grid;
+            grid-template-columns: repeat(4, 1fr);
+            gap: 12px;
+        }}
+        @media (max-width: 900px) {{
+            .kpi-grid {{
+                grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            }}
+        }}
         .metric-card {{
             background: white;
             border: 1px solid {GRIDCOLOR};
@@ -81,9 +98,13 @@ st.markdown(
             color: {P0} !important;
         }}
     </style>
-    """,
-    unsafe_allow_html=True
-)
+    """
+
+# =========================
+# Streamlit 기본 설정 + 스타일
+# =========================
+st.set_page_config(page_title="월별 매출 대시보드", layout="wide", page_icon="📊")
+st.markdown(_init_theme(), unsafe_allow_html=True)
 
 st.title("📊 월별 매출 대시보드 (Streamlit)")
 st.caption("CSV 업로드 후 4가지 시각화가 자동 생성됩니다. 컬럼: 월(YYYY-MM), 매출액, 전년동월, 증감률(%). 미입력 시 증감률은 전년동월로 자동 계산합니다.")
@@ -104,34 +125,189 @@ SAMPLE_CSV = (
     "2024-12,17000000,16500000,3.0\n"
 )
 
+SAMPLE_KEY = "sample"  # 샘플 데이터의 캐시 키 (업로드 파일은 내용 MD5)
+
+# Arrow 멀티스레드 CSV 파서 — 스키마 컬럼은 문자열로 읽고 숫자 변환은 enrich_df에서 관대하게
+# (파서 단계에서 타입을 고정하면 "1,000"/"-" 같은 셀 하나로 파일 전체가 거부됨)
+CSV_COLUMN_TYPES = {
+    "월": pa.string(),
+    "매출액": pa.string(),
+    "전년동월": pa.string(),
+    "증감률": pa.string(),
+}
+
+def read_csv(file) -> pa.Table:
+    try:
+        return pacsv.read_csv(file, convert_options=pacsv.ConvertOptions(column_types=CSV_COLUMN_TYPES))
+    except pa.ArrowInvalid:
+        # Arrow 파서는 열 개수가 모자란 행(선택 컬럼 증감률 생략, 공백뿐인 마지막 줄 등)을 거부
+        # → pandas 파서로 재시도해 빠진 칸은 null로 채움 (문자열로 읽고 숫자 변환은 enrich_df에서)
+        file.seek(0)
+        return pa.Table.from_pandas(pd.read_csv(file, dtype=str), preserve_index=False)
+
+# 증감률 결측 채우기 커널: 결측이면 전년동월로 계산(전년동월 0이면 0), 계산 불가(NaN)도 0
+# fastmath는 FMA 축약(contract)만 허용 — 전체 fastmath는 NaN 없음 가정으로 isnan 검사를 제거함
+# Polars to_numpy()는 null 유무에 따라 읽기전용 뷰/쓰기가능 복사본을 돌려줘 Numba가 조합마다 재컴파일함
+# → 읽기전용 'A' 레이아웃 시그니처로 한 번만 즉시 컴파일 (쓰기가능 배열도 안전하게 변환되어 같은 버전 사용)
+@njit(
+    types.float32[:](
+        types.Array(types.float64, 1, "A", readonly=True),
+        types.Array(types.float64, 1, "A", readonly=True),
+        types.Array(types.float32, 1, "A", readonly=True),
+    ),
+    cache=True, fastmath={"contract"},
+)
+def _fill_yoy(sales: np.ndarray, prev: np.ndarray, yoy: np.ndarray) -> np.ndarray:
+    out = np.empty(sales.shape[0], dtype=np.float32)
+    for i in range(sales.shape[0]):
+        v = np.float64(yoy[i])
+        if np.isnan(v):
+            p = np.float64(prev[i])
+            v = 0.0 if p == 0 else (np.float64(sales[i]) - p) / p * 100.0
+        out[i] = 0.0 if np.isnan(v) else v
+    return out
+
+# 캐시 키는 data_key(파일 해시)만 사용 — '_' 접두 인자는 Streamlit이 해싱하지 않음
+# 결과는 DataFrame 대신 Feather(Arrow) 바이트로 캐시 → 호출부에서 pd.read_feather로 복원
+# 정렬/차트용 날짜는 표시용 df에 넣지 않고 datetime64 배열로 따로 반환
 @st.cache_data
-def read_csv(file) -> pd.DataFrame:
-    return pd.read_csv(file)
+def enrich_df(data_key: str, _file_bytes: bytes) -> tuple[bytes, np.ndarray]:
+    # Arrow 테이블 → Polars (zero-copy), 이후 전처리는 Polars 표현식으로 한 번에 실행
+    df = pl.from_arrow(read_csv(io.BytesIO(_file_bytes)))
+    if "증감률" not in df.columns:
+        df = df.with_columns(pl.lit(None, dtype=pl.Float32).alias("증감률"))
+    month = pl.col("월").cast(pl.Utf8).str.strip_chars()
+    # YYYY-M(M): '-' 기준으로 나눠 월을 2자리로 채운 뒤 파싱 ("2024-1"도 2024-01, 형식 불일치 행은 null → NaT)
+    # 연도는 정확히 4자리 숫자만 허용 (%Y는 "24"나 "+2024"도 받아들이므로 사전 검사)
+    ym = month.str.splitn("-", 2)
+    year_part, month_part = ym.struct.field("field_0"), ym.struct.field("field_1")
+    month_start = pl.when(
+        year_part.str.contains(r"^\d{4}$") & month_part.str.contains(r"^\d{1,2}$")
+    ).then(pl.concat_str([year_part, pl.lit("-"), month_part.str.zfill(2), pl.lit("-01")]))
+
+    # 숫자로 해석되지 않는 셀은 null (pd.to_numeric(errors="coerce")와 동일)
+    def to_number(c: str, dtype: pl.DataType) -> pl.Expr:
+        return pl.col(c).cast(pl.Utf8).str.strip_chars().cast(dtype, strict=False)
+
+    df = df.with_columns(
+        month.alias("월"),
+        to_number("매출액", pl.Float64),  # 금액은 float32로 줄이면 2^24 초과 값이 반올림됨
+        to_number("전년동월", pl.Float64),
+        to_number("증감률", pl.Float32),
+        month_start.str.to_date("%Y-%m-%d", strict=False).alias("_date"),
+    ).sort("_date", nulls_last=True, maintain_order=True)
+    yoy = _fill_yoy(
+        df["매출액"].to_numpy().astype(np.float64, copy=False),
+        df["전년동월"].to_numpy().astype(np.float64, copy=False),
+        df["증감률"].to_numpy().astype(np.float32, copy=False),
+    )
+    df = df.with_columns(
+        pl.Series("증감률", yoy),
+        pl.col("_date").dt.quarter().cast(pl.Int8).alias("분기"),
+    )
+    # ns 범위(1677~2262년) 밖 날짜는 오류 대신 NaT (오타 한 칸으로 파일 전체가 거부되지 않도록)
+    dates = df["_date"].cast(pl.Datetime("ns"), strict=False).to_numpy()
+    buf = io.BytesIO()
+    # pandas 변환(전체 복사) 없이 Arrow 테이블을 그대로 Feather로 기록
+    table = df.drop("_date").to_arrow(compat_level=pl.CompatLevel.oldest())
+    # 반복값인 월/분기는 dictionary 인코딩 → pd.read_feather에서 category dtype으로 복원
+    for c in ["월", "분기"]:
+        table = table.set_column(table.schema.get_field_index(c), c, table[c].dictionary_encode())
+    feather.write_feather(table, buf, compression="uncompressed")
+    return buf.getvalue(), dates
 
+# 목표 대비 달성률(%) — 나눗셈 대신 역수 곱 (캐시는 build_kpi가 담당)
+def kpi_rate(sales: np.ndarray, target: int) -> np.ndarray:
+    return sales.astype(np.float32) * np.float32(100.0 / max(target, 1))
+
+# 분기별 박스플롯 통계 (Q1/중앙값/Q3 + 1.5×IQR 이내 최솟/최댓값 수염)
+def quarter_box_stats(df: pd.DataFrame) -> pd.DataFrame:
+    sales = df["매출액"]
+    quarter = df["분기"]
+    if not quarter.notna().any():  # 유효한 분기가 없으면 빈 박스플롯
+        return pd.DataFrame(columns=["q1", "median", "q3", "lowerfence", "upperfence"], dtype=float)
+    q = (
+        sales.groupby(quarter, observed=True).quantile([0.25, 0.5, 0.75])
+        .unstack().reindex(columns=[0.25, 0.5, 0.75])
+    )
+    iqr = q[0.75] - q[0.25]
+    lo = quarter.map(q[0.25] - 1.5 * iqr).astype(float)
+    hi = quarter.map(q[0.75] + 1.5 * iqr).astype(float)
+    return pd.DataFrame({
+        "q1": q[0.25],
+        "median": q[0.5],
+        "q3": q[0.75],
+        "lowerfence": sales.where(sales >= lo).groupby(quarter, observed=True).min(),
+        "upperfence": sales.where(sales <= hi).groupby(quarter, observed=True).max(),
+    })
+
+# =========================
+# 차트 빌더 — 완성된 figure를 dict로 캐시 (키: data_key, KPI 차트만 target 추가)
+# 캐시가 줄이는 것은 빌더 쪽 작업(리샘플링·분위수·trace 구성) — st.plotly_chart는 dict도 내부에서
+# Figure로 다시 검증하므로 렌더 비용은 동일. target 변경 시 나머지 3개 차트는 캐시 적중
+# =========================
 @st.cache_data
-def parse_sample(sample_text: str) -> pd.DataFrame:
-    return pd.read_csv(io.StringIO(sample_text))
+def build_trend(data_key: str, _df: pd.DataFrame, _dates: np.ndarray) -> dict:
+    valid = ~np.isnat(_dates)  # resampler는 x 단조증가 필요 → 월 파싱 실패(NaT) 행 제외
+    fig = FigureResampler(
+        go.Figure(), default_n_shown_samples=N_SHOWN_SAMPLES,
+        default_downsampler=MinMaxLTTB(parallel=True),
+        # 줌 시 재집계 콜백이 없으므로 [R]/~간격 표기는 붙이지 않음
+        resampled_trace_prefix_suffix=("", ""), show_mean_aggregation_size=False
+    )
+    fig.add_trace(go.Scattergl(
+        mode="lines+markers", name="매출액",
+        line=dict(width=3, color=P0), marker=dict(size=7, line=dict(width=1, color="#FFFFFF"))
+    ), hf_x=_dates[valid], hf_y=_df["매출액"].to_numpy()[valid])
+    fig.add_trace(go.Scattergl(
+        mode="lines+markers", name="전년동월",
+        line=dict(width=2, dash="dash", color=P2), marker=dict(size=6)
+    ), hf_x=_dates[valid], hf_y=_df["전년동월"].to_numpy()[valid])
+    fig.update_layout(yaxis_title="매출액 (원)", xaxis_title="월", xaxis_tickformat="%Y-%m", height=360)
+    return fig.to_dict()
 
 @st.cache_data
-def enrich_df(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
-    df["월"] = df["월"].astype(str).str.strip()
-    df["_date"] = pd.to_datetime(df["월"], format="%Y-%m", errors="coerce")
-    df = df.sort_values("_date").reset_index(drop=True)
-    for c in ["매출액", "전년동월"]:
-        df[c] = pd.to_numeric(df[c], errors="coerce")
-    if "증감률" in df.columns:
-        df["증감률"] = pd.to_numeric(df.get("증감률"), errors="coerce")
-    else:
-        df["증감률"] = np.nan
-    missing_mask = df["증감률"].isna()
-    df.loc[missing_mask & df["전년동월"].ne(0), "증감률"] = (
-        (df.loc[missing_mask, "매출액"] - df.loc[missing_mask, "전년동월"])
-        / df.loc[missing_mask, "전년동월"] * 100
+def build_yoy(data_key: str, _df: pd.DataFrame) -> dict:
+    months = _df["월"].tolist()  # x축 월 라벨은 한 번만 리스트로 변환
+    bar_colors = np.where(_df["증감률"].to_numpy() >= 0, P0, P2)
+    fig = go.Figure(go.Bar(
+        x=months, y=_df["증감률"], marker_color=bar_colors, name="증감률"
+    ))
+    fig.update_layout(yaxis_title="증감률 (%)", xaxis_title="월", xaxis_type="category", height=360)
+    return fig.to_dict()
+
+@st.cache_data
+def build_box(data_key: str, _df: pd.DataFrame) -> dict:
+    box = quarter_box_stats(_df)
+    fig = go.Figure(go.Box(
+        x=box.index.to_numpy(dtype=int), q1=box["q1"], median=box["median"], q3=box["q3"],
+        lowerfence=box["lowerfence"], upperfence=box["upperfence"],
+        name="매출액", marker_color=P1
+    ))
+    fig.update_layout(yaxis_title="매출액 (원)", xaxis_title="분기", height=360)
+    return fig.to_dict()
+
+@st.cache_data(max_entries=32)  # target 값마다 figure 하나씩 쌓이므로 상한 지정
+def build_kpi(data_key: str, _df: pd.DataFrame, _dates: np.ndarray, target: int) -> dict:
+    rate = kpi_rate(_df["매출액"].to_numpy(), target)
+    valid = ~np.isnat(_dates)  # resampler는 x 단조증가 필요 → 월 파싱 실패(NaT) 행 제외
+    fig = FigureResampler(
+        go.Figure(), default_n_shown_samples=N_SHOWN_SAMPLES,
+        default_downsampler=MinMaxLTTB(parallel=True),
+        # 줌 시 재집계 콜백이 없으므로 [R]/~간격 표기는 붙이지 않음
+        resampled_trace_prefix_suffix=("", ""), show_mean_aggregation_size=False
     )
-    df["증감률"] = df["증감률"].fillna(0)
-    df["분기"] = df["_date"].dt.quarter
-    return df
+    fig.add_trace(go.Scattergl(
+        mode="lines+markers", name="달성률",
+        line=dict(width=3, color=P1), marker=dict(size=7, line=dict(width=1, color="#FFFFFF"))
+    ), hf_x=_dates[valid], hf_y=rate[valid])
+    fig.add_hline(
+        y=100, line_dash="dash", line_color="#E53935",
+        annotation_text="목표 100%", annotation_position="top left",
+        annotation_font=dict(color="#E53935")
+    )
+    fig.update_layout(yaxis_title="달성률 (%)", xaxis_title="월", xaxis_tickformat="%Y-%m", height=360)
+    return fig.to_dict()
 
 # Sidebar
 with st.sidebar:
@@ -142,34 +318,44 @@ with st.sidebar:
 
 # Load data
 if uploaded is not None:
-    df_raw = read_csv(uploaded)
+    file_bytes = uploaded.getvalue()
+    data_key = hashlib.md5(file_bytes).hexdigest()
 elif use_sample:
-    df_raw = parse_sample(SAMPLE_CSV)
+    file_bytes = SAMPLE_CSV.encode("utf-8")
+    data_key = SAMPLE_KEY
 else:
     st.info("좌측에서 CSV를 업로드하거나 '샘플 데이터 불러오기'를 선택하세요.")
     st.stop()
 
 # Enrich
 try:
-    df = enrich_df(df_raw)
+    df_bytes, dates = enrich_df(data_key, file_bytes)
+    df = pd.read_feather(io.BytesIO(df_bytes))
 except Exception as e:
     st.error(f"데이터 처리 중 오류가 발생했습니다: {e}")
     st.stop()
 
-# KPI Cards
-col1, col2, col3, col4 = st.columns(4)
-with col1:
-    total_sales = int(df["매출액"].sum())
-    st.markdown(f"<div class='metric-card'><div style='color:{P1};font-size:13px;'>총합 매출</div><div style='color:{P0};font-weight:700;font-size:22px'>{total_sales:,.0f}원</div></div>", unsafe_allow_html=True)
-with col2:
-    avg_yoy = float(df["증감률"].mean())
-    st.markdown(f"<div class='metric-card'><div style='color:{P1};font-size:13px;'>평균 증감률</div><div style='color:{P0};font-weight:700;font-size:22px'>{avg_yoy:.1f}%</div></div>", unsafe_allow_html=True)
-with col3:
-    max_idx = df["매출액"].idxmax()
-    st.markdown(f"<div class='metric-card'><div style='color:{P1};font-size:13px;'>최고 매출 (월)</div><div style='color:{P0};font-weight:700;font-size:22px'>{df.loc[max_idx,'월']} · {df.loc[max_idx,'매출액']:,.0f}원</div></div>", unsafe_allow_html=True)
-with col4:
-    min_idx = df["매출액"].idxmin()
-    st.markdown(f"<div class='metric-card'><div style='color:{P1};font-size:13px;'>최저 매출 (월)</div><div style='color:{P0};font-weight:700;font-size:22px'>{df.loc[min_idx,'월']} · {df.loc[min_idx,'매출액']:,.0f}원</div></div>", unsafe_allow_html=True)
+# KPI Cards — 4개 카드를 CSS grid 하나로 묶어 st.markdown 1회로 출력
+sales_arr = df["매출액"].to_numpy()
+total_sales = int(np.nansum(sales_arr, dtype=np.float64))
+avg_yoy = float(df["증감률"].mean())
+max_i = int(np.nanargmax(sales_arr))
+min_i = int(np.nanargmin(sales_arr))
+kpi_cards = [
+    ("총합 매출", f"{total_sales:,.0f}원"),
+    ("평균 증감률", f"{avg_yoy:.1f}%"),
+    ("최고 매출 (월)", f"{df['월'].iat[max_i]} · {sales_arr[max_i]:,.0f}원"),
+    ("최저 매출 (월)", f"{df['월'].iat[min_i]} · {sales_arr[min_i]:,.0f}원"),
+]
+st.markdown(
+    "<div class='kpi-grid'>"
+    + "".join(
+        f"<div class='metric-card'><div style='color:{P1};font-size:13px;'>{label}</div><div style='color:{P0};font-weight:700;font-size:22px'>{value}</div></div>"
+        for label, value in kpi_cards
+    )
+    + "</div>",
+    unsafe_allow_html=True
+)
 
 st.divider()
 
@@ -180,55 +366,25 @@ row2_col1, row2_col2 = st.columns(2, gap="large")
 # 1) 월별 매출 추이 (좌상)
 with row1_col1:
     st.subheader("1) 월별 매출 추이 (매출액 vs 전년동월)")
-    fig_trend = go.Figure()
-    fig_trend.add_trace(go.Scatter(
-        x=df["월"], y=df["매출액"], mode="lines+markers", name="매출액",
-        line=dict(width=3, color=P0), marker=dict(size=7, line=dict(width=1, color="#FFFFFF"))
-    ))
-    fig_trend.add_trace(go.Scatter(
-        x=df["월"], y=df["전년동월"], mode="lines+markers", name="전년동월",
-        line=dict(width=2, dash="dash", color=P2), marker=dict(size=6)
-    ))
-    fig_trend.update_layout(yaxis_title="매출액 (원)", xaxis_title="월", height=360)
-    st.plotly_chart(fig_trend, use_container_width=True)
+    st.plotly_chart(build_trend(data_key, df, dates), use_container_width=True)
 
 # 2) 전년 대비 증감률 (우상)
 with row1_col2:
     st.subheader("2) 전년 대비 증감률")
-    bar_colors = [P0 if v >= 0 else P2 for v in df["증감률"]]
-    fig_yoy = go.Figure(go.Bar(
-        x=df["월"], y=df["증감률"], marker_color=bar_colors, name="증감률"
-    ))
-    fig_yoy.update_layout(yaxis_title="증감률 (%)", xaxis_title="월", height=360)
-    st.plotly_chart(fig_yoy, use_container_width=True)
+    st.plotly_chart(build_yoy(data_key, df), use_container_width=True)
 
 # 3) 분기별 매출 분포 (좌하)
 with row2_col1:
     st.subheader("3) 분기별 매출 분포 (Boxplot)")
-    fig_box = px.box(df, x="분기", y="매출액", points="all", color_discrete_sequence=[P1])
-    fig_box.update_traces(marker=dict(size=6, line=dict(width=1, color="#FFFFFF")))
-    fig_box.update_layout(yaxis_title="매출액 (원)", xaxis_title="분기", height=360)
-    st.plotly_chart(fig_box, use_container_width=True)
+    st.plotly_chart(build_box(data_key, df), use_container_width=True)
 
 # 4) 월별 KPI 달성률 (우하) + 목표선 빨간 점선
 with row2_col2:
     st.subheader("4) 월별 KPI 달성률 (목표선 100%)")
-    rate = (df["매출액"] / (target if target else 1)) * 100.0
-    fig_kpi = go.Figure()
-    fig_kpi.add_trace(go.Scatter(
-        x=df["월"], y=rate, mode="lines+markers", name="달성률",
-        line=dict(width=3, color=P1), marker=dict(size=7, line=dict(width=1, color="#FFFFFF"))
-    ))
-    fig_kpi.add_hline(
-        y=100, line_dash="dash", line_color="#E53935",
-        annotation_text="목표 100%", annotation_position="top left",
-        annotation_font=dict(color="#E53935")
-    )
-    fig_kpi.update_layout(yaxis_title="달성률 (%)", xaxis_title="월", height=360)
-    st.plotly_chart(fig_kpi, use_container_width=True)
+    st.plotly_chart(build_kpi(data_key, df, dates, target), use_container_width=True)
 
 st.divider()
 st.subheader("데이터 미리보기")
-st.dataframe(df.drop(columns=["_date"]))
+st.dataframe(df)
 
 st.caption("Tip: 좌측 사이드바에서 KPI 목표를 바꾸면 달성률 차트가 즉시 반영됩니다. 업로드 파일은 동일 스키마를 유지해주세요.")